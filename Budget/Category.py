@@ -2,12 +2,14 @@ class Category:
     def __init__(self, max_spending):
         self.max_spending = max_spending
         self.expenses = []
+        self.total_spending = 0
 
     def add_expense(self, amount):
         self.expenses.append(amount)
+        self.total_spending += amount
 
     def calculate_spending(self):
-        return sum(self.expenses)
+        return self.total_spending
 
 
 class Budget:
@@ -1,4 +1,6 @@
 class Expense:
+    __slots__ = ("name", "category", "amount", "due_date", "comments")
+
     def __init__(self, name, category, amount, due_date):
         self.name = name
         self.category = category
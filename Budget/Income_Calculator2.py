@@ -32,25 +32,18 @@ def calculate_average_income_for_six_months(conn, current_month, current_year):
         # Create a cursor object to execute SQL queries
         cursor = conn.cursor()
 
-        # Calculate the average income for the previous six months
-        total_income = 0
-        total_months = 0
+        # Calculate the first month of the six-month window and the first day of the current month
+        start_year, start_month = divmod(current_year * 12 + current_month - 1 - 6, 12)
+        window_start = f"{start_year}-{start_month + 1:02}-01"
+        window_end = f"{current_year}-{current_month:02}-01"
 
-        for i in range(1, 7):
-            # Calculate the month and year for the ith previous month
-            previous_month = (current_month - i) % 12
-            previous_year = current_year - 1 if previous_month == 0 else current_year
+        # Execute a single query to get the total credit income for the previous six months
+        query = "SELECT COALESCE(SUM(amount), 0) FROM transactions WHERE type='credit' AND date >= ? AND date < ?"
+        cursor.execute(query, (window_start, window_end))
 
-            # Execute a query to get credit transactions for the previous month
-            query = f"SELECT amount FROM transactions WHERE type='credit' AND strftime('%Y-%m', date) = '{previous_year}-{previous_month:02}'"
-            cursor.execute(query)
-
-            # Fetch all credit transactions for the previous month
-            credit_transactions = cursor.fetchall()
-
-            # Calculate the total income for the previous months
-            total_income += sum(transaction[0] for transaction in credit_transactions)
-            total_months += 1
+        # Fetch the total income for the previous months
+        total_income = cursor.fetchone()[0]
+        total_months = 6
 
         # Calculate the average income
         average_income = total_income / total_months if total_months > 0 else 0
@@ -73,9 +66,6 @@ def main():
     if conn is None:
         return
 
-    # Get credit transactions for the specified month and year
-    credit_transactions = get_credit_transactions_for_month(conn, selected_month, selected_year)
-
     # Calculate and display the average income for the previous six months
     average_income = calculate_average_income_for_six_months(conn, selected_month, selected_year)
     print(f"The average income for the previous six months is: {average_income}")
@@ -1,4 +1,11 @@
+import re
+
+# Precompiled pattern for the YYYY-MM-DD date format
+DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
 class IncomeSource:
+    __slots__ = ("name", "contact", "amount", "date")
+
     def __init__(self, name, contact, amount, date):
         self.name = name
         self.contact = contact
@@ -20,7 +27,7 @@ def add_income_source():
     # Validating the date input
     while True:
         date = input("Enter the date (YYYY-MM-DD): ")
-        if len(date) == 10 and date[4] == date[7] == '-' and date[:4].isdigit() and date[5:7].isdigit() and date[8:].isdigit():
+        if DATE_PATTERN.fullmatch(date):
             break
         else:
             print("Invalid date format. Please use YYYY-MM-DD.")
@@ -1,10 +1,8 @@
-import statistics
-
 def calculate_liquidity_reserve(expenses_history):
     if len(expenses_history) < 6:
         # Extrapolate data using statistical functions
         if len(expenses_history) > 1:
-            average_expense = statistics.mean(expenses_history)
+            average_expense = sum(expenses_history) / len(expenses_history)
             extrapolated_expenses = [average_expense] * (6 - len(expenses_history))
             expenses_history.extend(extrapolated_expenses)
         else:
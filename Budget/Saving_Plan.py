@@ -1,3 +1,6 @@
+PERIOD_MULTIPLIERS = {'yearly': 12, 'quarterly': 3, 'semi-annually': 6}
+
+
 class SavingsPlan:
     def __init__(self, name, initial_balance, monthly_contribution, interest_rate, duration):
         self.name = name
@@ -28,8 +31,7 @@ class SavingsPlan:
         return equivalent_monthly_contribution
 
     def _get_period_multiplier(self, contribution_period):
-        period_multipliers = {'yearly': 12, 'quarterly': 3, 'semi-annually': 6}
-        return period_multipliers.get(contribution_period, 1)
+        return PERIOD_MULTIPLIERS.get(contribution_period, 1)
 
 # Example usage:
 name = input("Enter the name of your savings plan: ")
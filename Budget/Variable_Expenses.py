@@ -1,4 +1,6 @@
 class Expense:
+    __slots__ = ("name", "amount", "category", "comment")
+
     def __init__(self, name, amount, category, comment=""):
         self.name = name
         self.amount = amount
@@ -7,8 +7,11 @@ from bs4 import BeautifulSoup
 from azure.identity import DefaultAzureCredential
 from azure.appservice.web import WebApp
 
+# Share one HTTP session so connections to WhatsApp and Bard are kept alive
+session = requests.Session()
+
 def get_message(url):
-  response = requests.get(url)
+  response = session.get(url)
   if response.status_code == 200:
     return response.json()
   else:
@@ -16,14 +19,14 @@ def get_message(url):
 
 def send_message(url, message):
   data = {"message": message}
-  response = requests.post(url, data=json.dumps(data))
+  response = session.post(url, data=json.dumps(data))
   if response.status_code == 200:
     return True
   else:
     raise Exception("Error sending message: {}".format(response.status_code))
 
 def get_bard_response(message):
-  response = requests.post("https://api.bard.ai/v1/dialog", json={"prompt": message})
+  response = session.post("https://api.bard.ai/v1/dialog", json={"prompt": message})
   if response.status_code == 200:
     return response.json()["text"]
   else:
@@ -45,9 +48,12 @@ def main():
   # Run the app
   app_service.start()
 
+  # Build the WhatsApp authorization headers once
+  whatsapp_headers = {"Authorization": "Bearer {}".format(access_token)}
+
   while True:
     # Get the message from WhatsApp
-    response = requests.get(whatsapp_business_api_url, headers={"Authorization": "Bearer {}".format(access_token)})
+    response = session.get(whatsapp_business_api_url, headers=whatsapp_headers)
     if response.status_code == 200:
       message = response.json()["messages"][0]
     else: